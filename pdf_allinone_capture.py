@@ -10,6 +10,7 @@ import sys
 import os
 import time
 import threading
+import queue
 import subprocess
 import ctypes # 추가된 부분
 from datetime import datetime
@@ -18,20 +19,25 @@ from datetime import datetime
 try:
     from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                                    QLabel, QSpinBox, QComboBox, QLineEdit, QFileDialog,
-                                   QMessageBox, QProgressBar, QTextEdit, QFrame, QScrollArea)
-    from PySide6.QtGui import QFont, QIcon, QScreen, QPainter, QPen, QColor
-    from PySide6.QtCore import Qt, Signal, QObject, QRect
+                                   QMessageBox, QProgressBar, QTextEdit, QFrame, QScrollArea, QCheckBox)
+    from PySide6.QtGui import QFont, QIcon, QScreen, QPainter, QPen, QColor, QTextCursor
+    from PySide6.QtCore import Qt, Signal, Slot, QObject, QRect, QThread, QTimer
     import pyautogui
-    from PIL import Image
+    import mss
+    import cv2
+    import numpy as np
+    import img2pdf
 except ImportError as e:
     missing_lib = str(e).split("'")[1]
+    # Module names that differ from their pip package names
+    pip_name = {"cv2": "opencv-python", "PIL": "Pillow"}.get(missing_lib, missing_lib)
     print(f"Required library not found: {missing_lib}")
-    print(f"Attempting to install '{missing_lib}'...")
+    print(f"Attempting to install '{pip_name}'...")
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", f"{missing_lib}"])
+        subprocess.check_call([sys.executable, "-m", "pip", "install", f"{pip_name}"])
         print("Installation successful. Please restart the application.")
     except Exception as install_e:
-        print(f"Failed to install {missing_lib}. Please install it manually: pip install {missing_lib}")
+        print(f"Failed to install {pip_name}. Please install it manually: pip install {pip_name}")
         print(f"Error: {install_e}")
     sys.exit()
 
@@ -81,34 +87,333 @@ class SnippingWidget(QWidget):
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint)
         self.setAttribute(Qt.WA_TranslucentBackground)
         
-        screen = QApplication.primaryScreen().geometry()
-        self.setGeometry(screen)
+        self.set_screen(QApplication.primaryScreen())
         
         self.begin = None
         self.end = None
+        self._pen = QPen(QColor(0, 120, 215, 255), 2)
+        self._brush = QColor(0, 120, 215, 50)
+        self._prev_rect = QRect()
+
+    def set_screen(self, screen):
+        self.setGeometry(screen.geometry())
+
+    def showEvent(self, event):
+        # The widget is reused between selections; start each one clean
+        self.begin = None
+        self.end = None
+        self._prev_rect = QRect()
+        super().showEvent(event)
 
     def paintEvent(self, event):
         if self.begin and self.end:
             rect = QRect(self.begin, self.end).normalized()
             painter = QPainter(self)
-            painter.setPen(QPen(QColor(0, 120, 215, 255), 2))
-            painter.setBrush(QColor(0, 120, 215, 50))
+            painter.setPen(self._pen)
+            painter.setBrush(self._brush)
             painter.drawRect(rect)
 
     def mousePressEvent(self, event):
         self.begin = event.pos()
         self.end = event.pos()
-        self.update()
+        self.update_selection()
 
     def mouseMoveEvent(self, event):
         self.end = event.pos()
-        self.update()
+        self.update_selection()
+
+    def update_selection(self):
+        # Repaint only the old and new selection (plus pen width), not the whole screen
+        rect = QRect(self.begin, self.end).normalized()
+        self.update(rect.united(self._prev_rect).adjusted(-2, -2, 2, 2))
+        self._prev_rect = rect
 
     def mouseReleaseEvent(self, event):
         self.close()
         rect = QRect(self.begin, self.end).normalized()
         self.on_snipped.emit(rect)
 
+# --- Capture Worker (runs on a QThread) ---
+class CaptureWorker(QObject):
+    log_signal = Signal(str)
+    progress_signal = Signal(int, str)
+    step_signal = Signal(int, str)
+    finished_signal = Signal(str)
+    failed_signal = Signal()
+    done_signal = Signal()
+
+    # Per-page log lines and progress are coalesced and sent at most this often (seconds)
+    UPDATE_INTERVAL = 0.1
+    # Upper bound on parallel page encoder threads
+    MAX_ENCODERS = 4
+    # PDF layout DPI when no target DPI is set
+    DEFAULT_DPI = 150
+    # Lowest usable Target DPI; anything below it (other than 0) means "Original"
+    MIN_TARGET_DPI = 72
+    # Page size (inches, portrait) that Target DPI scales pages to fit
+    PAGE_SIZE_INCHES = (8.5, 11)
+
+    def __init__(self, crop_area, total_pages, page_key, output_folder, keep_pages=False, page_delay=1.5, target_dpi=0):
+        super().__init__()
+        self.crop_area = crop_area
+        self.total_pages = total_pages
+        self.page_key = page_key
+        self.output_folder = output_folder
+        # Also write every page as PNG next to the PDF
+        self.keep_pages = keep_pages
+        # Longest wait (seconds) for the next page to appear after a key press
+        self.page_delay = page_delay
+        # 0 keeps captured pixels as-is; otherwise pages are downscaled to fit a
+        # Letter page at this DPI and the PDF is laid out at the same DPI
+        self.target_dpi = target_dpi if target_dpi >= self.MIN_TARGET_DPI else 0
+        self._stop_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self.page_jpegs = []
+        self.encode_error = None
+        self.encoded_count = 0
+        self._encode_lock = threading.Lock()
+        self._update_lock = threading.Lock()
+        self._log_buffer = []
+        self._pending_progress = None
+        self._last_update = 0.0
+
+    # Called from the GUI thread directly, not as queued slots: run_capture
+    # keeps this worker's thread busy, so queued calls would never run.
+    def stop(self):
+        self._stop_event.set()
+        self._resume_event.set()  # wake a paused worker so it sees the stop
+
+    def set_paused(self, paused):
+        if paused:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+
+    @Slot()
+    def run_capture(self):
+        try:
+            self.capture_pages_task()
+        finally:
+            self.flush_updates(force=True)
+            self.done_signal.emit()
+
+    # Called from both the capture and the encoder threads
+    def queue_log(self, message):
+        with self._update_lock:
+            self._log_buffer.append(message)
+        self.flush_updates()
+
+    def queue_progress(self, value, text):
+        with self._update_lock:
+            self._pending_progress = (value, text)
+        self.flush_updates()
+
+    def flush_updates(self, force=False):
+        with self._update_lock:
+            now = time.monotonic()
+            if not force and now - self._last_update < self.UPDATE_INTERVAL:
+                return
+            self._last_update = now
+            lines, self._log_buffer = self._log_buffer, []
+            progress, self._pending_progress = self._pending_progress, None
+        if lines: self.log_signal.emit("\n".join(lines))
+        if progress: self.progress_signal.emit(*progress)
+
+    # One-off messages go out immediately, after anything still buffered
+    def log(self, message):
+        self.flush_updates(force=True)
+        self.log_signal.emit(message)
+
+    def capture_pages_task(self):
+        try:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_folder = self.output_folder
+            capture_folder = None
+            if self.keep_pages:
+                capture_folder = os.path.join(output_folder, f"captured_pages_{timestamp}")
+                os.makedirs(capture_folder, exist_ok=True)
+                self.log(f"Capture folder created: {capture_folder}")
+
+            self.log("Please click on the document window. Capture will start in 3 seconds...")
+            if self._stop_event.wait(3):
+                self.log("Capture stopped by user.")
+                return
+
+            total = self.total_pages
+            page_key = self.page_key
+            # pyautogui sleeps 0.1 s after every call by default; the page wait below replaces that
+            pyautogui.PAUSE = 0
+            x, y, w, h = self.crop_area
+            monitor = {"left": x, "top": y, "width": w, "height": h}
+            self.page_jpegs = [None] * total
+            self.encode_error = None
+            self.encoded_count = 0
+            target_size = self.target_page_size(w, h)
+            if target_size:
+                self.log(f"Pages will be scaled to {target_size[0]}x{target_size[1]} for {self.target_dpi} DPI.")
+
+            # Encoding runs on its own threads so it overlaps the page-turn wait;
+            # the bounded queue keeps capture from running too far ahead.
+            # cv2 releases the GIL while encoding, so a few encoders run in parallel.
+            page_queue = queue.Queue(maxsize=8)
+            encoders = [threading.Thread(target=self.encode_pages_task,
+                                         args=(page_queue, self.page_jpegs, capture_folder, total, target_size), daemon=True)
+                        for _ in range(min(self.MAX_ENCODERS, os.cpu_count() or 1))]
+            for encoder in encoders:
+                encoder.start()
+            try:
+                with mss.mss() as sct:
+                    for page in range(1, total + 1):
+                        if self.encode_error:
+                            break
+                        if not self._resume_event.is_set():
+                            # Let in-flight pages finish and show them before blocking
+                            page_queue.join()
+                            self.flush_updates(force=True)
+                        # Blocks while paused; stop() also releases it
+                        self._resume_event.wait()
+                        if self._stop_event.is_set():
+                            self.log("Capture stopped by user.")
+                            self.page_jpegs = []
+                            return
+                        self.queue_log(f"Capturing page {page}/{total}...")
+
+                        frame = np.asarray(sct.grab(monitor))[:, :, :3]
+                        page_queue.put((page, frame))
+
+                        if page < total:
+                            prev = self.frame_fingerprint(frame)
+                            pyautogui.press(page_key)
+                            self.wait_for_page_change(sct, monitor, prev, timeout=self.page_delay)
+                            # Don't let this page's log line and progress wait for the next one
+                            self.flush_updates(force=True)
+            finally:
+                for _ in encoders:
+                    page_queue.put(None)
+                for encoder in encoders:
+                    encoder.join()
+
+            if self.encode_error:
+                raise self.encode_error
+            if not self._stop_event.is_set():
+                self.log("Capture phase complete.")
+                self.step_signal.emit(2, "completed")
+                self.create_pdf_task(timestamp)
+        except Exception as e:
+            self.log(f"Error during capture: {e}")
+            self.failed_signal.emit()
+
+    @staticmethod
+    def frame_sample(frame):
+        # ~64x64 BGR subsample; enough to tell pages apart and to see redraws settle
+        h, w = frame.shape[:2]
+        return frame[::max(1, h // 64), ::max(1, w // 64), :3]
+
+    @classmethod
+    def frame_fingerprint(cls, frame):
+        return hash(cls.frame_sample(frame).tobytes())
+
+    def wait_for_page_change(self, sct, monitor, prev, timeout):
+        # Wait until the capture area differs from the previous page and has then
+        # stopped changing (two consecutive samples nearly equal), so a half-drawn
+        # page isn't captured; `timeout` (the Page Delay setting) caps the wait.
+        t0 = time.monotonic()
+        changed = False
+        last = None
+        while time.monotonic() - t0 < timeout:
+            if self._stop_event.wait(0.05):
+                return
+            sample = self.frame_sample(np.asarray(sct.grab(monitor)))
+            if not changed:
+                changed = hash(sample.tobytes()) != prev
+            elif np.mean(cv2.absdiff(sample, last)) < 1.0:
+                return
+            last = sample
+
+    def target_page_size(self, w, h):
+        # Pixel size that fits PAGE_SIZE_INCHES at target_dpi (turned to match the
+        # crop's orientation), or None when no downscale is needed
+        if not self.target_dpi:
+            return None
+        short, long = (side * self.target_dpi for side in self.PAGE_SIZE_INCHES)
+        max_w, max_h = (short, long) if h >= w else (long, short)
+        scale = min(max_w / w, max_h / h)
+        if scale >= 1:
+            return None
+        return max(1, round(w * scale)), max(1, round(h * scale))
+
+    def encode_pages_task(self, page_queue, pages, capture_folder, total, target_size=None):
+        # Every frame of a run has the crop's size, so each encoder reuses one
+        # contiguous buffer; queued frames stay untouched until copied in here.
+        buf = None
+        while True:
+            item = page_queue.get()
+            try:
+                if item is None:
+                    return
+                if self._stop_event.is_set() or self.encode_error:
+                    continue  # keep draining so the capture thread never blocks on put()
+                page, frame = item
+                try:
+                    # The BGR slice of the BGRA grab is strided; make it contiguous once here
+                    # rather than letting every cv2 call below copy it again
+                    if buf is None or buf.shape != frame.shape:
+                        buf = np.empty(frame.shape, dtype=np.uint8)
+                    np.copyto(buf, frame)
+                    frame = buf
+                    if target_size:
+                        frame = cv2.resize(frame, target_size, interpolation=cv2.INTER_AREA)
+                    _, jpeg = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+                    pages[page - 1] = jpeg.tobytes()
+                    if capture_folder:
+                        # imencode + tofile instead of imwrite: imwrite can't handle non-ASCII paths on Windows
+                        _, png = cv2.imencode(".png", frame, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                        png.tofile(os.path.join(capture_folder, f"page_{page:04d}.png"))
+                except Exception as e:
+                    self.encode_error = e
+                    continue
+
+                # Pages can finish out of order, so progress counts encoded pages; it is
+                # queued under the lock so an older count can't overwrite a newer one
+                with self._encode_lock:
+                    self.encoded_count += 1
+                    done = self.encoded_count
+                    self.queue_progress(int((done / total) * 90), f"Captured: {done}/{total}")
+            finally:
+                page_queue.task_done()  # lets the capture thread join() in-flight pages before pausing
+
+    def create_pdf_task(self, timestamp):
+        try:
+            self.log("Creating PDF...")
+            self.step_signal.emit(3, "active")
+            self.progress_signal.emit(95, "Creating PDF...")
+
+            output_folder = self.output_folder
+            pdf_path = os.path.join(output_folder, f"SUPER_CAPT_{timestamp}.pdf")
+            if not self.page_jpegs: raise ValueError("No captured pages found.")
+
+            # JPEG pages are embedded as-is (DCTDecode), no re-encode; outputstream
+            # writes the PDF straight to the file instead of building it as one bytes object
+            dpi = self.target_dpi or self.DEFAULT_DPI
+            with open(pdf_path, "wb") as f:
+                img2pdf.convert(self.page_jpegs, layout_fun=img2pdf.get_fixed_dpi_layout_fun((dpi, dpi)), outputstream=f)
+            self.page_jpegs = []
+
+            # Stop was requested while the PDF was being written; don't report success
+            if self._stop_event.is_set():
+                os.remove(pdf_path)
+                self.log("Capture stopped by user. Partial PDF discarded.")
+                self.failed_signal.emit()
+                return
+
+            self.log(f"PDF created successfully: {pdf_path}")
+            self.step_signal.emit(3, "completed")
+            self.finished_signal.emit(pdf_path)
+        except Exception as e:
+            self.log(f"Error during PDF creation: {e}")
+            self.failed_signal.emit()
+
 # --- Main Application ---
 class SuperCaptApp(QWidget):
     class Communicate(QObject):
@@ -117,6 +422,16 @@ class SuperCaptApp(QWidget):
         step_signal = Signal(int, str)
         finished_signal = Signal(str)
 
+    KEY_MAP = {"Page Down": "pagedown", "Space": "space", "Enter": "enter", "Right Arrow": "right", "Down Arrow": "down"}
+    # 0 keeps the captured resolution
+    TARGET_DPI_PRESETS = {"Original": 0, "72": 72, "150": 150, "200": 200, "300": 300, "600": 600}
+
+    STEP_STYLES = {
+        "active": "color: #007acc; font-weight: bold;",
+        "completed": "color: #2a9d8f; font-weight: normal;",
+        "pending": "color: gray; font-weight: normal;",
+    }
+
     def __init__(self):
         super().__init__()
         self.comm = self.Communicate()
@@ -129,7 +444,11 @@ class SuperCaptApp(QWidget):
         self.is_capturing = False
         self.is_paused = False
         self.capture_thread = None
+        self.worker = None
         self.snipping_widget = None
+        self.snip_screen = None
+        self._log_second = None
+        self._log_stamp = ""
 
         self.init_ui()
 
@@ -162,11 +481,41 @@ class SuperCaptApp(QWidget):
         key_layout = QHBoxLayout()
         key_layout.addWidget(QLabel("Page Key:"))
         self.page_key_combo = QComboBox()
-        self.page_key_combo.addItems(["Page Down", "Space", "Enter", "Right Arrow", "Down Arrow"])
+        self.page_key_combo.addItems(list(self.KEY_MAP))
         self.page_key_combo.setCurrentText("Page Down")
         key_layout.addWidget(self.page_key_combo)
         settings_layout.addLayout(key_layout)
 
+        monitor_layout = QHBoxLayout()
+        monitor_layout.addWidget(QLabel("Monitor:"))
+        self.monitor_combo = QComboBox()
+        for i, screen in enumerate(QApplication.screens(), 1):
+            size = screen.geometry()
+            self.monitor_combo.addItem(f"{i}: {screen.name()} ({size.width()}x{size.height()})")
+        self.monitor_combo.setCurrentIndex(QApplication.screens().index(QApplication.primaryScreen()))
+        monitor_layout.addWidget(self.monitor_combo)
+        settings_layout.addLayout(monitor_layout)
+
+        delay_layout = QHBoxLayout()
+        delay_layout.addWidget(QLabel("Page Delay:"))
+        self.page_delay_spinbox = QSpinBox()
+        self.page_delay_spinbox.setRange(100, 10000)
+        self.page_delay_spinbox.setSingleStep(100)
+        self.page_delay_spinbox.setSuffix(" ms")
+        self.page_delay_spinbox.setValue(1500)
+        self.page_delay_spinbox.setToolTip("Maximum wait for the next page; capture continues as soon as the page changes.")
+        delay_layout.addWidget(self.page_delay_spinbox)
+        settings_layout.addLayout(delay_layout)
+
+        dpi_layout = QHBoxLayout()
+        dpi_layout.addWidget(QLabel("Target DPI:"))
+        self.target_dpi_combo = QComboBox()
+        self.target_dpi_combo.addItems(list(self.TARGET_DPI_PRESETS))
+        self.target_dpi_combo.setCurrentText("Original")
+        self.target_dpi_combo.setToolTip("Downscale pages larger than a Letter page at this DPI before saving.")
+        dpi_layout.addWidget(self.target_dpi_combo)
+        settings_layout.addLayout(dpi_layout)
+
         folder_layout = QHBoxLayout()
         self.output_folder_edit = QLineEdit(os.path.join(os.path.expanduser("~"), "Desktop"))
         folder_layout.addWidget(self.output_folder_edit)
@@ -175,6 +524,9 @@ class SuperCaptApp(QWidget):
         folder_layout.addWidget(self.browse_button)
         settings_layout.addLayout(folder_layout)
 
+        self.keep_pages_checkbox = QCheckBox("Keep page images (PNG)")
+        settings_layout.addWidget(self.keep_pages_checkbox)
+
         settings_box.setContentLayout(settings_layout)
 
         progress_frame = QFrame()
@@ -245,20 +597,29 @@ class SuperCaptApp(QWidget):
         """)
 
     def log(self, message):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"[{timestamp}] {message}")
+        # Timestamps only change once a second; format them once per second
+        now = int(time.time())
+        if now != self._log_second:
+            self._log_second = now
+            self._log_stamp = time.strftime("[%H:%M:%S]", time.localtime(now))
+        # The worker sends batches of lines; insert them in one go with repaints held off
+        text = "\n".join(f"{self._log_stamp} {line}" for line in message.split("\n"))
+        if not self.log_text.document().isEmpty():
+            text = "\n" + text
+        self.log_text.setUpdatesEnabled(False)
+        self.log_text.moveCursor(QTextCursor.End)
+        self.log_text.insertPlainText(text)
+        self.log_text.setUpdatesEnabled(True)
+        self.log_text.ensureCursorVisible()
 
     def update_step(self, step_index, status):
-        colors = {"active": "#007acc", "completed": "#2a9d8f", "pending": "gray"}
-        font_weights = {"active": "bold", "completed": "normal", "pending": "normal"}
-        
         for i, label in enumerate(self.step_labels):
             if i < step_index:
-                label.setStyleSheet(f"color: {colors['completed']}; font-weight: {font_weights['completed']};")
+                label.setStyleSheet(self.STEP_STYLES["completed"])
             elif i == step_index:
-                label.setStyleSheet(f"color: {colors[status]}; font-weight: {font_weights[status]};")
+                label.setStyleSheet(self.STEP_STYLES[status])
             else:
-                label.setStyleSheet(f"color: {colors['pending']}; font-weight: {font_weights['pending']};")
+                label.setStyleSheet(self.STEP_STYLES["pending"])
 
     def update_progress(self, value, text):
         self.progress_bar.setValue(value)
@@ -288,16 +649,40 @@ class SuperCaptApp(QWidget):
         self.log("Selecting crop area...")
         self.comm.step_signal.emit(1, "active")
         self.hide()
-        time.sleep(0.5)
-        
-        self.snipping_widget = SnippingWidget()
-        self.snipping_widget.on_snipped.connect(self.on_area_selected)
+        # Give the window time to disappear without blocking the event loop
+        QTimer.singleShot(200, self.show_snipping_widget)
+
+    def show_snipping_widget(self):
+        if self.snipping_widget is None:
+            self.snipping_widget = SnippingWidget()
+            self.snipping_widget.on_snipped.connect(self.on_area_selected)
+        screens = QApplication.screens()
+        index = self.monitor_combo.currentIndex()
+        self.snip_screen = screens[index] if 0 <= index < len(screens) else QApplication.primaryScreen()
+        self.snipping_widget.set_screen(self.snip_screen)
         self.snipping_widget.show()
 
+    def capture_rect(self, screen, rect):
+        # The selection is in Qt's device-independent pixels, local to `screen`;
+        # mss.grab wants physical pixels in global desktop coordinates.
+        # (macOS is the exception: mss works in points there, like Qt.)
+        ratio = 1.0 if sys.platform == "darwin" else screen.devicePixelRatio()
+        geo = screen.geometry()
+        left, top = geo.x(), geo.y()
+        size = (round(geo.width() * ratio), round(geo.height() * ratio))
+        # Take the screen's native origin from the matching mss monitor
+        with mss.mss() as sct:
+            matches = [m for m in sct.monitors[1:] if (m["width"], m["height"]) == size]
+        if matches:
+            m = min(matches, key=lambda mon: abs(mon["left"] - left) + abs(mon["top"] - top))
+            left, top = m["left"], m["top"]
+        return (left + round(rect.x() * ratio), top + round(rect.y() * ratio),
+                round(rect.width() * ratio), round(rect.height() * ratio))
+
     def on_area_selected(self, rect):
         self.show()
         if not rect.isEmpty():
-            self.crop_area = (rect.x(), rect.y(), rect.width(), rect.height())
+            self.crop_area = self.capture_rect(self.snip_screen, rect)
             self.log(f"Crop area selected: {self.crop_area}")
             self.comm.step_signal.emit(1, "completed")
             self.start_capture()
@@ -309,104 +694,46 @@ class SuperCaptApp(QWidget):
         self.log("Starting automatic capture...")
         self.is_capturing = True
         self.comm.step_signal.emit(2, "active")
-        
-        self.capture_thread = threading.Thread(target=self.capture_pages_task)
-        self.capture_thread.daemon = True
+        # Read settings on the GUI thread; the worker must not touch Qt widgets
+        self.worker = CaptureWorker(self.crop_area,
+                                    self.total_pages_spinbox.value(),
+                                    self.KEY_MAP[self.page_key_combo.currentText()],
+                                    self.output_folder_edit.text(),
+                                    self.keep_pages_checkbox.isChecked(),
+                                    self.page_delay_spinbox.value() / 1000,
+                                    self.TARGET_DPI_PRESETS[self.target_dpi_combo.currentText()])
+        # Parented to the window so a thread still winding down after Stop is not garbage-collected
+        self.capture_thread = QThread(self)
+        self.worker.moveToThread(self.capture_thread)
+        self.worker.log_signal.connect(self.log)
+        self.worker.progress_signal.connect(self.update_progress)
+        self.worker.step_signal.connect(self.update_step)
+        self.worker.finished_signal.connect(self.process_completed)
+        self.worker.failed_signal.connect(self.reset_ui)
+        # Direct: quit() is thread-safe, and a queued call could never run while
+        # closeEvent blocks the GUI thread in wait()
+        self.worker.done_signal.connect(self.capture_thread.quit, Qt.DirectConnection)
+        self.capture_thread.finished.connect(self.worker.deleteLater)
+        self.capture_thread.finished.connect(self.capture_thread.deleteLater)
+        self.capture_thread.finished.connect(self.capture_thread_finished)
+        self.capture_thread.started.connect(self.worker.run_capture)
         self.capture_thread.start()
 
-    def get_key(self):
-        key_map = {"Page Down": "pagedown", "Space": "space", "Enter": "enter", "Right Arrow": "right", "Down Arrow": "down"}
-        return key_map.get(self.page_key_combo.currentText())
-
-    def capture_pages_task(self):
-        try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_folder = self.output_folder_edit.text()
-            capture_folder = os.path.join(output_folder, f"captured_pages_{timestamp}")
-            os.makedirs(capture_folder, exist_ok=True)
-            self.comm.log_signal.emit(f"Capture folder created: {capture_folder}")
-
-            self.comm.log_signal.emit("Please click on the document window. Capture will start in 3 seconds...")
-            time.sleep(3)
-
-            total = self.total_pages_spinbox.value()
-            page_key = self.get_key()
-
-            for page in range(1, total + 1):
-                if not self.is_capturing:
-                    self.comm.log_signal.emit("Capture stopped by user.")
-                    return
-                while self.is_paused: time.sleep(0.1)
-                self.comm.log_signal.emit(f"Capturing page {page}/{total}...")
-                
-                screenshot = pyautogui.screenshot()
-                filepath = os.path.join(capture_folder, f"page_{page:04d}.png")
-                screenshot.save(filepath)
-
-                progress = int((page / total) * 50)
-                self.comm.progress_signal.emit(progress, f"Captured: {page}/{total}")
-                
-                if page < total:
-                    pyautogui.press(page_key)
-                    time.sleep(1.5)
-
-            if self.is_capturing:
-                self.comm.log_signal.emit("Capture phase complete.")
-                self.comm.step_signal.emit(2, "completed")
-                self.crop_and_create_pdf_task(capture_folder, timestamp)
-        except Exception as e:
-            self.comm.log_signal.emit(f"Error during capture: {e}")
-            self.reset_ui()
-
-    def crop_and_create_pdf_task(self, capture_folder, timestamp):
-        try:
-            self.comm.log_signal.emit("Cropping and creating PDF...")
-            self.comm.step_signal.emit(3, "active")
-            
-            output_folder = self.output_folder_edit.text()
-            cropped_folder = os.path.join(output_folder, f"cropped_pages_{timestamp}")
-            os.makedirs(cropped_folder, exist_ok=True)
-
-            image_files = sorted([f for f in os.listdir(capture_folder) if f.endswith('.png')])
-            total_images = len(image_files)
-
-            for i, filename in enumerate(image_files, 1):
-                if not self.is_capturing:
-                    self.comm.log_signal.emit("Process stopped during cropping.")
-                    return
+    def capture_running(self):
+        # The worker can still be winding down (joining encoders, writing the PDF)
+        # after Stop has already reset the UI
+        return self.capture_thread is not None and self.capture_thread.isRunning()
 
-                input_path = os.path.join(capture_folder, filename)
-                output_path = os.path.join(cropped_folder, filename)
-                
-                with Image.open(input_path) as img:
-                    x, y, w, h = self.crop_area
-                    cropped = img.crop((x, y, x + w, y + h))
-                    cropped.save(output_path)
-                
-                progress = 50 + int((i / total_images) * 40)
-                self.comm.progress_signal.emit(progress, f"Cropping: {i}/{total_images}")
-
-            self.comm.log_signal.emit("Cropping complete. Creating PDF...")
-            self.comm.step_signal.emit(3, "completed")
-            self.comm.step_signal.emit(4, "active")
-            self.comm.progress_signal.emit(95, "Creating PDF...")
-
-            pdf_path = os.path.join(output_folder, f"SUPER_CAPT_{timestamp}.pdf")
-            cropped_files = sorted([os.path.join(cropped_folder, f) for f in os.listdir(cropped_folder) if f.endswith('.png')])
-            if not cropped_files: raise ValueError("No cropped images found.")
-
-            with Image.open(cropped_files[0]).convert("RGB") as first_image:
-                other_images = [Image.open(f).convert("RGB") for f in cropped_files[1:]]
-                first_image.save(pdf_path, save_all=True, append_images=other_images, resolution=150.0)
-            
-            self.comm.log_signal.emit(f"PDF created successfully: {pdf_path}")
-            self.comm.finished_signal.emit(pdf_path)
-        except Exception as e:
-            self.comm.log_signal.emit(f"Error during PDF creation: {e}")
-            self.reset_ui()
+    def capture_thread_finished(self):
+        self.capture_thread = None
+        self.worker = None
+        # Start stays disabled until the previous run's thread has really exited
+        if not self.is_capturing:
+            self.start_button.setEnabled(True)
 
     def pause_process(self):
         self.is_paused = not self.is_paused
+        if self.worker: self.worker.set_paused(self.is_paused)
         if self.is_paused:
             self.pause_button.setText("Resume")
             self.log("Process paused.")
@@ -417,11 +744,12 @@ class SuperCaptApp(QWidget):
     def stop_process(self):
         if QMessageBox.question(self, "Confirm Stop", "Are you sure you want to stop?") == QMessageBox.Yes:
             self.is_capturing = False
+            if self.worker: self.worker.stop()
             self.log("Process stopping...")
             self.reset_ui()
 
     def reset_ui(self):
-        self.start_button.setEnabled(True)
+        self.start_button.setEnabled(not self.capture_running())
         self.pause_button.setEnabled(False); self.pause_button.setText("Pause")
         self.stop_button.setEnabled(False)
         self.update_progress(0, "Ready")
@@ -435,18 +763,36 @@ class SuperCaptApp(QWidget):
         self.comm.step_signal.emit(4, "completed")
         reply = QMessageBox.information(self, "Success!", f"PDF created successfully!\n\nPath: {pdf_path}", QMessageBox.Ok | QMessageBox.Open)
         if reply == QMessageBox.Open:
+            self.open_pdf(pdf_path)
+
+    def open_pdf(self, pdf_path):
+        # Hand the file to the OS viewer without blocking the GUI thread on
+        # file-association lookup; errors come back through the log signal
+        def run():
             try:
-                os.startfile(pdf_path)
+                if sys.platform == "win32":
+                    os.startfile(pdf_path)
+                else:
+                    opener = "open" if sys.platform == "darwin" else "xdg-open"
+                    subprocess.Popen([opener, pdf_path], start_new_session=True)
             except Exception as e:
-                self.log(f"Failed to open PDF: {e}")
+                self.comm.log_signal.emit(f"Failed to open PDF: {e}")
+        threading.Thread(target=run, daemon=True).start()
 
     def closeEvent(self, event):
-        if self.is_capturing:
+        if self.capture_running():
             reply = QMessageBox.question(self, 'Confirm Exit', "A capture process is running. Exit anyway?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.Yes:
                 self.is_capturing = False
-                if self.capture_thread: self.capture_thread.join(timeout=2)
-                event.accept()
+                if self.worker: self.worker.stop()
+                if self.capture_thread.wait(5000):
+                    event.accept()
+                else:
+                    # Still busy (e.g. writing the PDF); exiting now would destroy a
+                    # running QThread, so hide and quit once it has finished
+                    self.capture_thread.finished.connect(QApplication.quit)
+                    self.hide()
+                    event.ignore()
             else:
                 event.ignore()
         else:
@@ -455,19 +801,20 @@ class SuperCaptApp(QWidget):
 # --- 자동 관리자 권한 실행을 위한 함수 및 로직 ---
 def is_admin():
     try:
-        return ctypes.windll.shell32.IsUserAnAdmin()
-    except:
+        return bool(ctypes.windll.shell32.IsUserAnAdmin())
+    except Exception:
         return False
 
 if __name__ == '__main__':
-    # 스크립트가 관리자 권한으로 실행되었는지 확인
-    if is_admin():
-        # 관리자 권한이 있으면, 정상적으로 앱 실행
+    # 스크립트가 관리자 권한으로 실행되었는지 확인 (시작 시 한 번만 검사)
+    # UAC 권한 상승은 Windows 전용이므로 다른 OS에서는 그대로 실행
+    if os.name == "nt" and not is_admin():
+        # 관리자 권한이 없으면, UAC 프롬프트를 띄워서 관리자 권한으로 다시 실행
+        ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
+        sys.exit()
+    else:
+        # 관리자 권한이 있거나 Windows가 아니면, 정상적으로 앱 실행
         app = QApplication(sys.argv)
         ex = SuperCaptApp()
         ex.show()
         sys.exit(app.exec())
-    else:
-        # 관리자 권한이 없으면, UAC 프롬프트를 띄워서 관리자 권한으로 다시 실행
-        ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
-        sys.exit()